@@ -2,9 +2,6 @@
 import os
 import sys
 
-# Import the main application class from our new tui module
-from unscheduler.tui import UnscheduleApp
-
 def main():
     """The main entry point for the application."""
     if len(sys.argv) != 2:
@@ -16,6 +13,9 @@ def main():
         print(f"Error: File '{schedule_file}' not found.")
         return
 
+    # Imported here so usage errors don't pay for the TUI stack
+    from unscheduler.tui import UnscheduleApp
+
     # Create an instance of our Textual app and run it
     app = UnscheduleApp(schedule_file=schedule_file)
     app.run()
@@ -18,14 +18,34 @@ def test_simple_block_parsing():
     assert "TestCategory" in categories
     
     event = commitments[0]
-    assert event['recurrence'] == 'Weekly'
-    assert event['day_code'] == 'M'
-    assert event['type'] == 'block'
-    assert event['start'] == '09:00'
-    assert event['end'] == '10:00'
-    assert event['event'] == 'Test Event'
-    assert event['category'] == 'TestCategory'
-    assert not event['spans_midnight']
+    assert event.recurrence == 'Weekly'
+    assert event.day_code == 'M'
+    assert event.type == 'block'
+    assert event.start == '09:00'
+    assert event.end == '10:00'
+    assert event.event == 'Test Event'
+    assert event.category == 'TestCategory'
+    assert not event.spans_midnight
+
+def test_time_token_formats():
+    """Tests the flexible time formats ('9a', '10:30p', '5pm', '13:00')."""
+    schedule_content = """
+    Weekly M 9a 10:30p Long Event
+    Weekly T 5pm 13:00 Backwards Event
+    Weekly W 4:15p Trigger Event
+    """
+    mock_file_stream = io.StringIO(schedule_content)
+
+    commitments, _, _, errors = _parse_content(mock_file_stream)
+
+    assert not errors
+    assert len(commitments) == 3
+    assert commitments[0].start == '09:00'
+    assert commitments[0].end == '22:30'
+    assert commitments[1].start == '17:00'
+    assert commitments[1].spans_midnight
+    assert commitments[2].type == 'trigger'
+    assert commitments[2].time == '16:15'
 
 def test_non_work_definition_parsing():
     """Tests if the parser correctly identifies non-work categories."""
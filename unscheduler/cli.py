@@ -5,8 +5,6 @@ import subprocess
 import argparse
 from pathlib import Path
 
-from .tui import UnscheduleApp, SettingsManager
-
 
 def main():
     """CLI entry point for the unscheduler application."""
@@ -16,7 +14,10 @@ def main():
     parser.add_argument('--no-pdf', action='store_true', help='Do not open PDF files automatically')
     
     args = parser.parse_args()
-    
+
+    # Deferred so `unscheduler --help` doesn't pay for the TUI stack
+    from .tui import UnscheduleApp, SettingsManager
+
     # Load settings to get last file
     settings_mgr = SettingsManager()
     settings = settings_mgr.load_settings()
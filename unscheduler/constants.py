@@ -2,6 +2,8 @@
 
 BLOCK_BORDER_WIDTH = 1.0
 DAY_CODES = "MTWRFSU"
+DAY_CODES_SET = frozenset(DAY_CODES)
+DAY_INDEX = {c: i for i, c in enumerate(DAY_CODES)}
 DAY_NAME_MAP = {
     'M': 'Monday', 'T': 'Tuesday', 'W': 'Wednesday', 'R': 'Thursday',
     'F': 'Friday', 'S': 'Saturday', 'U': 'Sunday'
@@ -10,4 +12,21 @@ COLOR_PALETTE = [
     "#AEC7E8", "#FFBB78", "#98DF8A", "#FF9896", "#C5B0D5", "#C49C94",
     "#F7B6D2", "#DBDB8D", "#9EDAE5", "#AD494A"
 ]
-DEFAULT_TRIGGER_COLOR = "black"
\ No newline at end of file
+DEFAULT_TRIGGER_COLOR = "black"
+# UFL class period mapping (string times keep the labels exact)
+UFL_PERIODS = {
+    'P1': ('07:25', '08:15'),
+    'P2': ('08:30', '09:20'),
+    'P3': ('09:35', '10:25'),
+    'P4': ('10:40', '11:30'),
+    'P5': ('11:45', '12:35'),
+    'P6': ('12:50', '13:40'),
+    'P7': ('13:55', '14:45'),
+    'P8': ('15:00', '15:50'),
+    'P9': ('16:05', '16:55'),
+    'P10': ('17:10', '18:00'),
+    'P11': ('18:15', '19:05'),
+    'PE1': ('19:20', '20:10'),
+    'PE2': ('20:20', '21:10'),
+    'PE3': ('21:20', '22:10'),
+}
@@ -1,80 +1,98 @@
 # unscheduler/stats.py
-from datetime import datetime
-from .constants import DAY_CODES, DAY_NAME_MAP
+from operator import attrgetter
 
+import numpy as np
+from .constants import DAY_CODES, DAY_INDEX, DAY_NAME_MAP
 
-def check_for_overlaps(all_commitments: list):
-    """Checks for and prints informational warnings about overlapping time blocks."""
-    print("\n--- Checking for overlaps ---")
+
+def check_for_overlaps(all_commitments: list, out: list = None):
+    """Checks for overlapping time blocks.
+
+    Report lines are appended to *out* when given, otherwise printed.
+    """
+    emit = out.append if out is not None else print
+    emit("\n--- Checking for overlaps ---")
     found_overlap = False
 
-    # Group by both day_code AND recurrence to separate WeekA/WeekB
+    # One pass to bucket blocks by day AND recurrence (to separate
+    # WeekA/WeekB) instead of re-scanning the full list per combination
+    buckets = [{} for _ in DAY_CODES]
+    for e in all_commitments:
+        if e.type == 'block':
+            buckets[DAY_INDEX[e.day_code]].setdefault(
+                e.recurrence, []).append(e)
+
     for day_code in DAY_CODES:
+        day_buckets = buckets[DAY_INDEX[day_code]]
         for recurrence in ['Weekly', 'WeekA', 'WeekB']:
-            daily_blocks = sorted([
-                e for e in all_commitments
-                if e['type'] == 'block'
-                and e['day_code'] == day_code
-                and e['recurrence'] == recurrence
-            ], key=lambda x: x['start'])
-
+            daily_blocks = day_buckets.get(recurrence, [])
             if len(daily_blocks) < 2:
                 continue
+            daily_blocks.sort(key=attrgetter('start_min'))
 
             for i in range(1, len(daily_blocks)):
                 prev_event = daily_blocks[i-1]
                 curr_event = daily_blocks[i]
-                if curr_event['start'] < prev_event['end']:
+                if curr_event.start_min < prev_event.end_min:
                     found_overlap = True
                     day_name = DAY_NAME_MAP.get(day_code, 'Unknown Day')
                     recurrence_label = f" ({recurrence})" if recurrence != 'Weekly' else ""
-                    print(
-                        f"  Warning: Overlap on {day_name}{recurrence_label} -> '{prev_event['event']}' ({prev_event['start']}-{prev_event['end']}) and '{curr_event['event']}' ({curr_event['start']}-{curr_event['end']})")
+                    emit(
+                        f"  Warning: Overlap on {day_name}{recurrence_label} -> '{prev_event.event}' ({prev_event.start}-{prev_event.end}) and '{curr_event.event}' ({curr_event.start}-{curr_event.end})")
 
     if not found_overlap:
-        print("  No overlaps found.")
+        emit("  No overlaps found.")
+
 
+def calculate_and_print_stats(all_commitments: list, all_categories: set, non_work_categories: list, out: list = None):
+    """Calculates the final, unified time allocation report.
 
-def calculate_and_print_stats(all_commitments: list, all_categories: set, non_work_categories: list):
-    """Calculates and prints the final, unified time allocation report."""
+    Report lines are appended to *out* when given, otherwise printed.
+    """
+    emit = out.append if out is not None else print
     category_hours = {}
-    FMT = '%H:%M'
-    for event in all_commitments:
-        if event['type'] == 'block':
-            start = datetime.strptime(event['start'], FMT)
-            end = datetime.strptime(event['end'], FMT)
-            duration = (end - start).total_seconds() / 3600
-            if duration < 0:
-                duration += 24
-
-            multiplier = 2 if event['recurrence'] == 'Weekly' else 1
-            biweekly_duration = duration * multiplier
-
-            category = event.get('category')
-            if category:
-                category_hours[category] = category_hours.get(
-                    category, 0) + biweekly_duration
-
-    print("\n--- Weekly Time Allocation Analysis ---")
-    work_categories = sorted(list(all_categories - set(non_work_categories)))
-    print(
+    blocks = [e for e in all_commitments
+              if e.type == 'block' and e.category]
+    if blocks:
+        # Vectorized duration math over the minute-of-day ints stored by
+        # the parser; no string parsing needed here at all.
+        n = len(blocks)
+        starts = np.fromiter((e.start_min for e in blocks),
+                             dtype=np.int32, count=n)
+        ends = np.fromiter((e.end_min for e in blocks),
+                           dtype=np.int32, count=n)
+        durations = (ends - starts) / 60.0
+        durations[durations < 0] += 24
+        multipliers = np.fromiter((2 if e.recurrence == 'Weekly' else 1
+                                   for e in blocks), dtype=np.int32, count=n)
+
+        cat_to_idx = {}
+        cat_idx = np.fromiter((cat_to_idx.setdefault(e.category, len(cat_to_idx))
+                               for e in blocks), dtype=np.int32, count=n)
+        hours = np.zeros(len(cat_to_idx))
+        np.add.at(hours, cat_idx, durations * multipliers)
+        category_hours = {cat: hours[idx] for cat, idx in cat_to_idx.items()}
+
+    emit("\n--- Weekly Time Allocation Analysis ---")
+    work_categories = sorted(all_categories.difference(non_work_categories))
+    emit(
         f"NON-WORK Categories: {', '.join(non_work_categories) if non_work_categories else 'None defined'}")
-    print(
+    emit(
         f"WORK Categories:     {', '.join(work_categories) if work_categories else 'None defined'}")
-    print("-" * 52)
+    emit("-" * 52)
 
     total_scheduled = sum(category_hours.values())
     total_hours = 2 * 7 * 24
     category_hours['Unscheduled'] = total_hours - total_scheduled
 
-    print(f"{'Category':<15} | {'Avg. Hours/Wk':<15} | {'Avg. Hours/Day':<15}")
-    print("-" * 52)
+    emit(f"{'Category':<15} | {'Avg. Hours/Wk':<15} | {'Avg. Hours/Day':<15}")
+    emit("-" * 52)
 
     sorted_categories = sorted(
         category_hours.items(), key=lambda item: item[1], reverse=True)
 
     for cat, total_hrs in sorted_categories:
-        print(f"{cat:<15} | {(total_hrs / 2):<15.1f} | {(total_hrs / 14):<15.1f}")
+        emit(f"{cat:<15} | {(total_hrs / 2):<15.1f} | {(total_hrs / 14):<15.1f}")
 
     total_work_hours = sum(category_hours.get(cat, 0)
                            for cat in work_categories)
@@ -83,5 +101,5 @@ def calculate_and_print_stats(all_commitments: list, all_categories: set, non_wo
     avg_available_wk = total_available_hours / 2
     avg_available_day = total_available_hours / 14
 
-    print("-" * 52)
-    print(f"{'Work+Unscheduled':<15} | {avg_available_wk:<15.1f} | {avg_available_day:<15.1f}")
+    emit("-" * 52)
+    emit(f"{'Work+Unscheduled':<15} | {avg_available_wk:<15.1f} | {avg_available_day:<15.1f}")
@@ -1,26 +1,28 @@
 # unscheduler/tui.py
 import os
-import io
 import re
 import json
+import time
+import hashlib
+import functools
+import threading
 import subprocess
 from pathlib import Path
-import contextlib
-import humanize
 from datetime import datetime
 from typing import Optional, Tuple
 
-from dateutil.parser import parse as parse_dt
-
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Vertical, Horizontal
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, Label, Input
 from textual.reactive import reactive
 
-from .parser import parse_schedule_file, get_events_for_week
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+from .parser import parse_schedule_content, partition_by_week
 from .stats import check_for_overlaps, calculate_and_print_stats
-from .visualizer import create_calendar_pdf
 
 
 # Minimal prompt screen for entering a time string (e.g., "5pm", "17:00", "5", "24:00")
@@ -50,39 +52,81 @@ class TimePrompt(Screen):
 # Start-hour: floor minutes (7:30 -> 7), min=0, must be < end
 # End-hour: ceil minutes (7:30 -> 8), max=24, must be > start
 _H24_RE = re.compile(r"^\s*24(?::?0{2})?\s*$")
-_H_RE = re.compile(r"^\s*(\d{1,2})\s*$")
 
 
 def parse_start_hour(s: str) -> int:
     s = s.strip()
-    if _H24_RE.match(s):
-        raise ValueError("24:00 invalid for start")
-    m = _H_RE.match(s)
-    if m:
-        h = int(m.group(1))
+    try:
+        h = int(s)  # the overwhelmingly common input ("5", "17")
+    except ValueError:
+        pass
+    else:
+        if h in (24, 2400):  # both spellings _H24_RE accepted
+            raise ValueError("24:00 invalid for start")
         if not (0 <= h <= 23):
             raise ValueError("hour out of range for start")
         return h
+    if _H24_RE.match(s):
+        raise ValueError("24:00 invalid for start")
+    from dateutil.parser import parse as parse_dt  # deferred fallback
     dt = parse_dt(s)
     return dt.hour  # floor minutes by taking the hour
 
 
 def parse_end_hour(s: str) -> int:
     s = s.strip()
-    if _H24_RE.match(s):
-        return 24
-    m = _H_RE.match(s)
-    if m:
-        h = int(m.group(1))
-        if h == 24:
+    try:
+        h = int(s)  # the overwhelmingly common input ("8", "22", "24")
+    except ValueError:
+        pass
+    else:
+        if h in (24, 2400):  # both spellings _H24_RE accepted
             return 24
         if not (0 <= h <= 23):
             raise ValueError("hour out of range for end")
         return h
+    if _H24_RE.match(s):
+        return 24
+    from dateutil.parser import parse as parse_dt  # deferred fallback
     dt = parse_dt(s)
     return dt.hour if dt.minute == 0 else min(dt.hour + 1, 24)  # ceil minutes
 
 
+class _ScheduleFileHandler(FileSystemEventHandler):
+    """Forwards filesystem events for the watched schedule file into the app."""
+
+    def __init__(self, app, target_path: str):
+        self.app = app
+        self.target_path = target_path
+
+    def _maybe_notify(self, path) -> None:
+        if path == self.target_path:
+            self.app.call_from_thread(self.app._schedule_refresh)
+
+    def on_modified(self, event):
+        self._maybe_notify(event.src_path)
+
+    def on_created(self, event):
+        self._maybe_notify(event.src_path)
+
+    def on_moved(self, event):
+        # Many editors save via write-to-temp + rename
+        self._maybe_notify(event.dest_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _naturaltime(ts: int, now_bucket: int) -> str:
+    """Cached humanize.naturaltime; now_bucket pins the cache to the current second."""
+    del now_bucket  # only part of the cache key
+    import humanize  # deferred: only needed once labels render
+    return humanize.naturaltime(datetime.fromtimestamp(ts))
+
+
+def _timestamp_label(prefix: str, when: datetime) -> str:
+    relative = _naturaltime(int(when.timestamp()), int(time.time()))
+    return f"{prefix}  {when.strftime('%Y-%m-%d %H:%M:%S')} ({relative})"
+
+
 class SettingsManager:
     def __init__(self):
         self.config_dir = Path.home() / '.config' / 'unscheduler'
@@ -107,11 +151,15 @@ class SettingsManager:
             return self.default_settings.copy()
 
     def save_settings(self, settings):
-        """Save settings to file."""
+        """Save settings to file atomically."""
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Compact encoding; write-to-temp + rename so a watcher tick
+            # never sees a half-written file
+            data = json.dumps(settings, separators=(',', ':')).encode()
+            tmp = self.config_file.with_suffix('.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, self.config_file)
             return True
         except Exception:
             return False
@@ -143,6 +191,16 @@ class UnscheduleApp(App):
         self.schedule_file_path = schedule_file
         self.all_commitments, self.all_categories, self.non_work_cats = [], set(), []
         self._reload_timer = None
+        self._last_mtime_ns = 0
+        self._refresh_timer = None
+        self._observer = None
+        self._parse_cache = {}  # content hash -> (parse results, report text)
+        self._content_hash = None
+        self._last_render_key = None
+        self._render_lock = threading.Lock()
+        self._label_cache = {}
+        self._widgets = {}
+        self._save_handle = None
         self.on_first_render_callback = on_first_render_callback
         self._first_render_done = False
 
@@ -180,27 +238,65 @@ class UnscheduleApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Resolve widgets once; query_one walks the DOM on every call
+        self._widgets = {
+            "#status_label": self.query_one("#status_label", Label),
+            "#report_panel": self.query_one("#report_panel", Static),
+            "#file_mod_label": self.query_one("#file_mod_label", Label),
+            "#pdf_gen_label": self.query_one("#pdf_gen_label", Label),
+        }
         self.update_status_line()
         self.run_analysis()
-        self._reload_timer = self.set_interval(1.0, self._maybe_reload_on_save)
+        self._start_file_watcher()
+
+    def _start_file_watcher(self) -> None:
+        """Watch the schedule file via inotify/FSEvents; poll only as a fallback."""
+        try:
+            target = os.path.abspath(self.schedule_file_path)
+            self._observer = Observer()
+            self._observer.schedule(
+                _ScheduleFileHandler(self, target),
+                os.path.dirname(target) or '.')
+            self._observer.start()
+        except Exception:
+            self._observer = None
+            self._reload_timer = self.set_interval(
+                1.0, self._maybe_reload_on_save)
+
+    def on_unmount(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+
+    def _schedule_refresh(self) -> None:
+        # Coalesce bursts of writes (editors often write twice per save)
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(0.3, self.run_analysis)
 
     def _maybe_reload_on_save(self) -> None:
+        # Integer nanosecond compare; no float or datetime math per tick
         try:
-            current_mod = datetime.fromtimestamp(
-                os.path.getmtime(self.schedule_file_path))
-            if current_mod > self.last_file_mod_time:
-                self.run_analysis()
+            st = os.stat(self.schedule_file_path)
         except FileNotFoundError:
             self._safe_update(
                 "#report_panel", "[bold red]Error: schedule file not found.[/]")
+            return
+        if st.st_mtime_ns > self._last_mtime_ns:
+            self._schedule_refresh()
 
     def _safe_update(self, selector: str, text: str) -> None:
         try:
-            node = self.query_one(selector)
+            node = self._widgets.get(selector) or self.query_one(selector)
             node.update(text)
         except Exception:
             pass
 
+    def _update_label(self, selector: str, text: str) -> None:
+        """Update a label only when its text actually changed."""
+        if self._label_cache.get(selector) != text:
+            self._label_cache[selector] = text
+            self._safe_update(selector, text)
+
     def update_status_line(self) -> None:
         weekends_status = "On" if self.show_weekends else "Off"
         status = f"Orientation: {self.orientation} | Time Range: {self.start_hour:02d}:00 to {self.end_hour:02d}:00 | Time Format: {self.time_format} | Weekends: {weekends_status}"
@@ -208,89 +304,165 @@ class UnscheduleApp(App):
 
     def run_analysis(self) -> None:
         try:
-            # Capture analysis output
-            self.last_file_mod_time = datetime.fromtimestamp(
-                os.path.getmtime(self.schedule_file_path))
-            out = io.StringIO()
-            with contextlib.redirect_stdout(out):
-                self.all_commitments, self.all_categories, self.non_work_cats, errors = parse_schedule_file(
-                    self.schedule_file_path)
-                if errors:
-                    self._safe_update(
-                        "#report_panel", "[bold red]Parsing errors detected.[/]")
-                    return
-                check_for_overlaps(self.all_commitments)
-                calculate_and_print_stats(
-                    self.all_commitments, self.all_categories, self.non_work_cats)
-            self._safe_update("#report_panel", out.getvalue())
-
-            # Generate calendars
-            figsize = (8.5, 11) if self.orientation == "Portrait" else (11, 8.5)
-            week_a_events = get_events_for_week(self.all_commitments, "A")
-            create_calendar_pdf(week_a_events, "Week A", self.start_hour,
-                                self.end_hour, self.time_format, figsize, self.show_weekends)
-            week_b_events = get_events_for_week(self.all_commitments, "B")
-            create_calendar_pdf(week_b_events, "Week B", self.start_hour,
-                                self.end_hour, self.time_format, figsize, self.show_weekends)
-            
-            # Combine PDFs using pdftk
-            try:
-                subprocess.run(['pdftk', 'week_a.pdf', 'week_b.pdf', 'cat', 'output', 'weeks.pdf'], 
-                             check=True, capture_output=True)
-            except Exception:
-                pass  # Silent fail if pdftk not available
-            
-            self.last_pdf_gen_time = datetime.now()
-            
-            # Trigger callback on first render only
-            if not self._first_render_done and self.on_first_render_callback:
-                self._first_render_done = True
-                self.on_first_render_callback()
-            
-            self._safe_update(
-                "#pdf_gen_label",
-                f"Calendars Generated:  {self.last_pdf_gen_time.strftime('%Y-%m-%d %H:%M:%S')} ({humanize.naturaltime(self.last_pdf_gen_time)})",
-            )
-            self._safe_update(
-                "#file_mod_label",
-                f"Source File Modified:  {self.last_file_mod_time.strftime('%Y-%m-%d %H:%M:%S')} ({humanize.naturaltime(self.last_file_mod_time)})",
-            )
-            self.update_status_line()
+            if self._reparse_if_changed():
+                self._render_pdfs()
         except Exception as e:
             self._safe_update(
                 "#report_panel", f"[bold red]An error occurred during analysis:\n{e}[/]")
 
-    # Watchers keep the single status line current
-    def watch_orientation(self, old_value: str, new_value: str) -> None:
+    def _reparse_if_changed(self) -> bool:
+        """Re-reads the schedule, parsing only when its content changed.
+
+        Returns True when the commitments are ready for rendering.
+        """
+        st = os.stat(self.schedule_file_path)
+        self._last_mtime_ns = st.st_mtime_ns
+        # datetime only materialized for the label
+        self.last_file_mod_time = datetime.fromtimestamp(st.st_mtime_ns / 1e9)
+        with open(self.schedule_file_path, 'rb') as f:
+            data = f.read()
+        content_hash = hashlib.blake2b(data, digest_size=16).digest()
+        self._update_label(
+            "#file_mod_label",
+            _timestamp_label("Source File Modified:",
+                             self.last_file_mod_time))
+
+        # Reuse parse results when the content is unchanged
+        cached = self._parse_cache.get(content_hash)
+        if cached is None:
+            out = []
+            parsed = parse_schedule_content(
+                data.decode('utf-8', 'replace'))
+            commitments, categories, non_work, errors = parsed
+            if not errors:
+                check_for_overlaps(commitments, out)
+                calculate_and_print_stats(
+                    commitments, categories, non_work, out)
+            cached = (parsed, '\n'.join(out))
+            self._parse_cache[content_hash] = cached
+            while len(self._parse_cache) > 2:
+                self._parse_cache.pop(next(iter(self._parse_cache)))
+
+        (self.all_commitments, self.all_categories,
+         self.non_work_cats, errors), report = cached
+        if errors:
+            self._content_hash = None  # block rendering of stale events
+            error_lines = "\n".join(
+                f"  Line {line_no}: '{raw}' -> {message}"
+                for line_no, raw, message in errors)
+            self._safe_update(
+                "#report_panel",
+                f"[bold red]Parsing errors detected:[/]\n{error_lines}")
+            return False
+        self._content_hash = content_hash
+        self._safe_update("#report_panel", report)
+        self.update_status_line()
+        return True
+
+    def _render_pdfs(self) -> None:
+        """Regenerates the calendar PDFs unless nothing they depend on changed."""
+        if self._content_hash is None:
+            return
+        render_key = (self._content_hash, self.orientation, self.time_format,
+                      self.start_hour, self.end_hour, self.show_weekends)
+        if render_key == self._last_render_key:
+            return
+        # Generate calendars off the event loop so the TUI stays responsive
+        figsize = (8.5, 11) if self.orientation == "Portrait" else (11, 8.5)
+        weeks = partition_by_week(self.all_commitments)
+        self._regen_pdfs(weeks['A'], weeks['B'], figsize, render_key)
+        self.update_status_line()
+
+    @work(thread=True, exclusive=True, group="pdf_render")
+    def _regen_pdfs(self, week_a_events: list, week_b_events: list, figsize: tuple, render_key) -> None:
+        try:
+            # Deferred so matplotlib is only imported once a render is due
+            from .visualizer import create_calendar_pdfs
+
+            # The lock guards against a new render starting while a
+            # cancelled-but-still-finishing one is mid-write.
+            with self._render_lock:
+                # The two weeks are independent; render them concurrently
+                create_calendar_pdfs([
+                    (week_a_events, "Week A", self.start_hour,
+                     self.end_hour, self.time_format, figsize, self.show_weekends),
+                    (week_b_events, "Week B", self.start_hour,
+                     self.end_hour, self.time_format, figsize, self.show_weekends),
+                ])
+
+                # Combine PDFs using pdftk
+                try:
+                    subprocess.run(['pdftk', 'week_a.pdf', 'week_b.pdf', 'cat', 'output', 'weeks.pdf'],
+                                   check=True, capture_output=True)
+                except Exception:
+                    pass  # Silent fail if pdftk not available
+            self.call_from_thread(self._on_pdfs_generated, render_key)
+        except Exception as e:
+            self.call_from_thread(
+                self._safe_update,
+                "#report_panel", f"[bold red]An error occurred during PDF generation:\n{e}[/]")
+
+    def _on_pdfs_generated(self, render_key) -> None:
+        self.last_pdf_gen_time = datetime.now()
+        self._last_render_key = render_key
+
+        # Trigger callback on first render only
+        if not self._first_render_done and self.on_first_render_callback:
+            self._first_render_done = True
+            self.on_first_render_callback()
+
+        self._update_label(
+            "#pdf_gen_label",
+            _timestamp_label("Calendars Generated:", self.last_pdf_gen_time))
+
+    def _schedule_settings_save(self) -> None:
+        """Debounces disk writes so a burst of toggles persists once."""
+        if not self.is_running:
+            return  # saved settings are being applied at startup
+        if self._save_handle is not None:
+            self._save_handle.stop()
+        self._save_handle = self.set_timer(0.25, self._commit_settings_save)
+
+    def _commit_settings_save(self) -> None:
+        self._save_handle = None
         self._save_settings()
 
+    # Watchers persist settings changes (debounced)
+    def watch_orientation(self, old_value: str, new_value: str) -> None:
+        self._schedule_settings_save()
+
     def watch_time_format(self, old_value: str, new_value: str) -> None:
-        self._save_settings()
+        self._schedule_settings_save()
 
     def watch_start_hour(self, old_value: int, new_value: int) -> None:
-        self._save_settings()
+        self._schedule_settings_save()
 
     def watch_end_hour(self, old_value: int, new_value: int) -> None:
-        self._save_settings()
+        self._schedule_settings_save()
 
     def watch_show_weekends(self, old_value: bool, new_value: bool) -> None:
-        self._save_settings()
+        self._schedule_settings_save()
 
     # Actions
     def action_force_refresh(self) -> None:
+        # A user-driven refresh drops the caches so the PDFs really are
+        # regenerated - they may have been deleted, or a pdftk merge may
+        # have failed silently - even when nothing else changed
+        self._parse_cache.clear()
+        self._last_render_key = None
         self.run_analysis()
 
     def action_toggle_orientation(self) -> None:
         self.orientation = "Portrait" if self.orientation == "Landscape" else "Landscape"
-        self.run_analysis()
+        self._render_pdfs()
 
     def action_toggle_time_format(self) -> None:
         self.time_format = "12h" if self.time_format == "24h" else "24h"
-        self.run_analysis()
+        self._render_pdfs()
 
     def action_toggle_weekends(self) -> None:
         self.show_weekends = not self.show_weekends
-        self.run_analysis()
+        self._render_pdfs()
 
     def action_set_start_hour(self) -> None:
         def _apply(result: Optional[str]) -> None:
@@ -301,7 +473,7 @@ class UnscheduleApp(App):
                 if not (0 <= new_start < self.end_hour):
                     raise ValueError("start must be < end")
                 self.start_hour = new_start
-                self.run_analysis()
+                self._render_pdfs()
             except Exception as ex:
                 self._safe_update(
                     "#report_panel", f"[bold yellow]Invalid start time ({result}): {ex}[/]")
@@ -317,7 +489,7 @@ class UnscheduleApp(App):
                 if not (self.start_hour < new_end <= 24):
                     raise ValueError("end must be > start and <= 24")
                 self.end_hour = new_end
-                self.run_analysis()
+                self._render_pdfs()
             except Exception as ex:
                 self._safe_update(
                     "#report_panel", f"[bold yellow]Invalid end time ({result}): {ex}[/]")
@@ -1,10 +1,18 @@
 # unscheduler/visualizer.py
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib as mpl
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import FigureCanvasPdf
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import FontProperties
 import matplotlib.ticker as mticker
-import textwrap
-from datetime import datetime
-from .constants import BLOCK_BORDER_WIDTH
+import numpy as np
+from functools import lru_cache
+from .constants import BLOCK_BORDER_WIDTH, UFL_PERIODS
 
 # UFL periods for calendar labeling
 UFL_PERIODS_DISPLAY = {
@@ -24,43 +32,62 @@ UFL_PERIODS_DISPLAY = {
     'PE3': (21.333333, 22.166667),  # 9:20 to 10:10
 }
 
-# UFL period mapping (string format for accurate times)
-UFL_PERIODS = {
-    'P1': ('07:25', '08:15'),
-    'P2': ('08:30', '09:20'),
-    'P3': ('09:35', '10:25'),
-    'P4': ('10:40', '11:30'),
-    'P5': ('11:45', '12:35'),
-    'P6': ('12:50', '13:40'),
-    'P7': ('13:55', '14:45'),
-    'P8': ('15:00', '15:50'),
-    'P9': ('16:05', '16:55'),
-    'P10': ('17:10', '18:00'),
-    'P11': ('18:15', '19:05'),
-    'PE1': ('19:20', '20:10'),
-    'PE2': ('20:20', '21:10'),
-    'PE3': ('21:20', '22:10'),
-}
+# PDF rendering knobs, set once at import: maximum stream compression
+# and path simplification keep the output files small
+mpl.rcParams.update({
+    'pdf.compression': 9,
+    'pdf.fonttype': 42,  # subsetted TrueType, far smaller than Type 3
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+})
 
 # Render-time mode for labels: "24h" or "12h"
 TIME_FORMAT_MODE = "24h"
 
+# Resolution for rasterized artists (the event blocks) in saved PDFs
+EVENT_RASTER_DPI = 200
+
+# Page insets in inches: the 0.5in page margin plus room for the period
+# labels (left), hour ticks (right), day labels (bottom), and title (top)
+_MARGIN_LEFT_IN = 1.35
+_MARGIN_RIGHT_IN = 1.15
+_MARGIN_BOTTOM_IN = 0.85
+_MARGIN_TOP_IN = 1.25
+
+# Filename mangling table: title -> snake_case stem in one C-level pass
+_FN_TABLE = str.maketrans({' ': '_'})
+
+# Shared font objects so matplotlib does not rebuild FontProperties
+# (and redo font resolution) for every ax.text call in the event pass
+_LABEL_FONT = FontProperties(size=8)
+_TRIGGER_FONT = FontProperties(size=6)
+
 
+@lru_cache(maxsize=512)
 def time_to_float(time_str: str) -> float:
     h, m = map(int, time_str.split(":"))
     return h + m / 60.0
 
 
+@lru_cache(maxsize=256)
 def get_text_color_for_bg(hex_color: str) -> str:
     h = hex_color.lstrip("#")
+    if len(h) != 6:
+        return "black"  # named colors like 'gray' keep dark text
     r, g, b = tuple(int(h[i: i + 2], 16) for i in (0, 2, 4))
     luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
     return "black" if luminance > 0.5 else "white"
 
 
+@lru_cache(maxsize=512)
 def _format_time_12h(time_str: str) -> str:
-    # Linux-friendly 12h formatting; on macOS/Linux %-I avoids leading zero
-    return datetime.strptime(time_str, "%H:%M").strftime("%-I:%M %p")
+    # Plain string math: no strptime/strftime round-trip and no
+    # platform-dependent %-I flag
+    h, m = time_str.split(":")
+    h = int(h)
+    suffix = "AM" if h < 12 else "PM"
+    h12 = h % 12 or 12
+    return f"{h12}:{m} {suffix}"
 
 
 def format_time_ampm(time_str: str) -> str:
@@ -73,12 +100,13 @@ def format_time_ampm(time_str: str) -> str:
     return _format_time_12h(time_str)
 
 
-def _format_hour_tick(v: float) -> str:
+@lru_cache(maxsize=512)
+def _format_hour_tick(v: float, mode: str) -> str:
     # Only label integer hours
     if abs(v - round(v)) > 1e-6:
         return ""
     h = int(round(v)) % 24
-    if TIME_FORMAT_MODE == "24h":
+    if mode == "24h":
         return f"{h:02d}:00"
     h12 = h % 12 or 12
     suffix = "AM" if h < 12 else "PM"
@@ -87,149 +115,165 @@ def _format_hour_tick(v: float) -> str:
 
 def draw_events_on_grid(ax, events: list, start_h: int, end_h: int, num_days: int):
     """Draws events, clipping them to the visible time window and day range."""
-    day_map = {code: i for i, code in enumerate("MTWRFSU")}
-    for event in events:
-        day_index = day_map.get(event["day_code"])
-        if day_index is None or day_index >= num_days:
-            continue
-
-        if event["type"] == "block":
-            s, e, color = (
-                time_to_float(event["start"]),
-                time_to_float(event["end"]),
-                event["color"],
-            )
-            if event.get("spans_midnight", False):
-                text_color = get_text_color_for_bg(color)
-                # Evening part on the original day
-                if max(s, start_h) < min(24.0, end_h) and day_index < num_days:
-                    rect_start = max(s, start_h)
-                    rect_end = min(24.0, end_h)
-
-                    ax.add_patch(
-                        patches.Rectangle(
-                            (day_index, rect_start),
-                            1,
-                            rect_end - rect_start,
-                            facecolor=color,
-                            edgecolor="black",
-                            linewidth=BLOCK_BORDER_WIDTH,
-                            alpha=0.7,
-                            zorder=3,
-                        )
-                    )
-
-                    # Fix: Position text within visible rectangle
-                    text_y = rect_start + 0.1
-                    ax.text(
-                        day_index + 0.5,
-                        text_y,
-                        event["event"],
-                        ha="center",
-                        va="top",
-                        color=text_color,
-                        fontsize=8,
-                        weight="normal",
-                        zorder=5,
-                    )
-
-                # Morning part on the next day
-                next_day_index = (day_index + 1) % 7
-                if max(0.0, start_h) < min(e, end_h) and next_day_index < num_days:
-                    rect_start = max(0.0, start_h)
-                    rect_end = min(e, end_h)
-
-                    ax.add_patch(
-                        patches.Rectangle(
-                            (next_day_index, rect_start),
-                            1,
-                            rect_end - rect_start,
-                            facecolor=color,
-                            edgecolor="black",
-                            linewidth=BLOCK_BORDER_WIDTH,
-                            alpha=0.7,
-                            zorder=3,
-                        )
-                    )
-
-                    # Fix: Position text within visible rectangle
-                    text_y = rect_start + 0.1
-                    ax.text(
-                        next_day_index + 0.5,
-                        text_y,
-                        event["event"],
-                        ha="center",
-                        va="top",
-                        color=text_color,
-                        fontsize=8,
-                        weight="normal",
-                        zorder=5,
-                    )
-            else:
-                # Regular event (doesn't span midnight)
-                if max(s, start_h) < min(e, end_h):
-                    text_color = get_text_color_for_bg(color)
-                    rect_start = max(s, start_h)
-                    rect_end = min(e, end_h)
-
-                    ax.add_patch(
-                        patches.Rectangle(
-                            (day_index, rect_start),
-                            1,
-                            rect_end - rect_start,
-                            facecolor=color,
-                            edgecolor="black",
-                            linewidth=BLOCK_BORDER_WIDTH,
-                            alpha=0.7,
-                            zorder=5,
-                        )
-                    )
-
-                    # Fix: Position text within visible rectangle
-                    text_y = rect_start + 0.1
-                    ax.text(
-                        day_index + 0.5,
-                        text_y,
-                        event["event"],
-                        ha="center",
-                        va="top",
-                        color=text_color,
-                        fontsize=8,
-                        weight="normal",
-                        zorder=5,
+    blocks = [e for e in events if e.type == "block"]
+    triggers = [e for e in events if e.type == "trigger"]
+
+    if blocks:
+        # Structure-of-arrays pass: clipping and visibility run as array
+        # ops instead of per-event Python branches, then one
+        # PolyCollection carries every visible rectangle.
+        n = len(blocks)
+        day_idx = np.fromiter((e.day_index for e in blocks),
+                              dtype=np.intp, count=n)
+        starts = np.fromiter((e.start_min for e in blocks),
+                             dtype=np.float64, count=n) / 60.0
+        ends = np.fromiter((e.end_min for e in blocks),
+                           dtype=np.float64, count=n) / 60.0
+        spans = np.fromiter((e.spans_midnight for e in blocks),
+                            dtype=bool, count=n)
+
+        # Midnight spanners contribute an evening segment on their own
+        # day plus a morning segment on the next; src maps each segment
+        # back to its block for colors and labels.
+        wrap = np.nonzero(spans)[0]
+        src = np.concatenate([np.arange(n), wrap])
+        seg_day = np.concatenate([day_idx, (day_idx[wrap] + 1) % 7])
+        seg_start = np.concatenate([starts, np.zeros(len(wrap))])
+        seg_end = np.concatenate([np.where(spans, 24.0, ends), ends[wrap]])
+
+        # A segment is drawn only if it survives clipping, lands on a
+        # shown day, AND its event's own day is shown - without the last
+        # check a hidden-Sunday midnight spanner would wrap onto Monday,
+        # which the per-event loop never did.
+        orig_day = np.concatenate([day_idx, day_idx[wrap]])
+        rect_start = np.maximum(seg_start, start_h)
+        rect_end = np.minimum(seg_end, end_h)
+        visible = ((rect_start < rect_end) & (seg_day < num_days)
+                   & (orig_day < num_days))
+
+        idx = np.nonzero(visible)[0]
+        if len(idx):
+            x0 = seg_day[idx].astype(np.float64)
+            y0 = rect_start[idx]
+            y1 = rect_end[idx]
+            verts = np.stack([
+                np.column_stack([x0, y0]),
+                np.column_stack([x0 + 1, y0]),
+                np.column_stack([x0 + 1, y1]),
+                np.column_stack([x0, y1]),
+            ], axis=1)
+            # One collection per unique color: a scalar facecolor is a
+            # single graphics-state change at draw time, and a schedule
+            # rarely uses more than the ten palette colors
+            by_color = defaultdict(list)
+            for pos, seg in enumerate(src[idx]):
+                by_color[blocks[seg].color].append(pos)
+            for color, positions in by_color.items():
+                ax.add_collection(
+                    PolyCollection(
+                        verts[positions],
+                        facecolor=color,
+                        edgecolors="black",
+                        linewidths=BLOCK_BORDER_WIDTH,
+                        alpha=0.7,
+                        zorder=3,
+                        # Filled blocks rasterize at EVENT_RASTER_DPI in
+                        # the PDF; grid lines and text stay vector-crisp
+                        rasterized=True,
                     )
-
-        elif event["type"] == "trigger":
-            t = time_to_float(event["time"])
-            if start_h <= t <= end_h:
-                trigger_text = f"{format_time_ampm(event['time'])} → {event['event']}"
+                )
+            for seg, x, y, h in zip(src[idx], x0, y0, y1 - y0):
+                if h < 0.25:
+                    # No readable room for a label in under fifteen
+                    # minutes of visible height; skip the Text artist
+                    continue
+                event = blocks[seg]
                 ax.text(
-                    day_index + 0.5,
-                    t,
-                    trigger_text,
+                    x + 0.5,
+                    y + 0.1,  # text sits just inside the visible rectangle
+                    event.event,
                     ha="center",
-                    va="bottom",
-                    color=event["color"],
-                    fontsize=6,
-                    weight="regular",
+                    va="top",
+                    color=get_text_color_for_bg(event.color),
+                    fontproperties=_LABEL_FONT,
                     zorder=5,
                 )
 
+    for event in triggers:
+        if event.day_index >= num_days:
+            continue
+        t = event.time_min / 60.0
+        if start_h <= t <= end_h:
+            trigger_text = f"{format_time_ampm(event.time)} → {event.event}"
+            ax.text(
+                event.day_index + 0.5,
+                t,
+                trigger_text,
+                ha="center",
+                va="bottom",
+                color=event.color,
+                fontproperties=_TRIGGER_FONT,
+                zorder=5,
+            )
 
-def create_calendar_pdf(
-    events: list,
+
+# Cached figure skeletons keyed by (title, start_h, end_h, time_format,
+# figsize, show_weekends). Building the static furniture (grid, ticks,
+# period labels) dominates PDF cost, so live-mode refreshes reuse it and
+# only redraw the event artists. One skeleton per title keeps each
+# cached figure single-owner, but the dict itself is shared by the
+# concurrent week renders, so all access goes through the lock.
+_FIG_CACHE = {}
+_FIG_CACHE_LOCK = threading.Lock()
+
+
+def _clear_events(ax, baseline: tuple):
+    """Removes every artist added after the skeleton was built."""
+    n_patches, n_texts, n_collections = baseline
+    for artist in list(ax.patches[n_patches:]):
+        artist.remove()
+    for artist in list(ax.texts[n_texts:]):
+        artist.remove()
+    for artist in list(ax.collections[n_collections:]):
+        artist.remove()
+
+
+@lru_cache(maxsize=64)
+def _period_labels(start_h: int, end_h: int, mode: str) -> tuple:
+    """Visible UFL period annotations for a time window, as
+    (label_y, period, time_str) tuples. Constant per (window, mode), so
+    cached rather than reformatted for every skeleton build."""
+    labels = []
+    for period, (start_time, end_time) in UFL_PERIODS_DISPLAY.items():
+        if start_h <= start_time <= end_h:
+            label_y = (start_time + end_time) / 2
+            # Original time strings from UFL_PERIODS (avoid floating point errors)
+            start_orig, end_orig = UFL_PERIODS[period]
+            if mode == "24h":
+                time_str = f"{start_orig}-{end_orig}"
+            else:
+                time_str = (f"{_format_time_12h(start_orig)}"
+                            f"-{_format_time_12h(end_orig)}")
+            labels.append((label_y, period, time_str))
+    return tuple(labels)
+
+
+def _build_skeleton(
     title: str,
     start_h: int,
     end_h: int,
     time_format: str,
     figsize: tuple,
-    show_weekends: bool = True,
+    show_weekends: bool,
 ):
-    """Creates and saves a single week's calendar PDF."""
-    global TIME_FORMAT_MODE
-    TIME_FORMAT_MODE = time_format
-
-    fig, ax = plt.subplots(figsize=figsize)
+    """Builds a figure with all the static calendar furniture for one week."""
+    # The pyplot state machine is not thread-safe; the OO Figure API is,
+    # which lets callers render several weeks concurrently.
+    fig = Figure(figsize=figsize, dpi=EVENT_RASTER_DPI)
+    # Bind the PDF canvas up front so savefig never has to infer and
+    # swap in a backend per call; the canvas lives with the cached figure
+    FigureCanvasPdf(fig)
+    ax = fig.add_subplot()
     days = [
         "Monday",
         "Tuesday",
@@ -251,35 +295,26 @@ def create_calendar_pdf(
     ax.set_xlabel("")
     ax.set_ylim(end_h, start_h)
 
-    # Day columns as minor gridlines
-    ax.set_xticks(range(0, num_days + 1), minor=True)
-    ax.grid(True, which="minor", axis="x",
-            linestyle="-", linewidth=0.9, zorder=1)
-
-    # Weekend divider between Friday (index 4) and Saturday (index 5)
-    # Only draw if weekends are shown
+    # Day column separators plus the weekend divider as one collection;
+    # one artist instead of the minor-grid pass and a separate axvline
+    segments = [[(i, start_h), (i, end_h)] for i in range(num_days + 1)]
+    colors = ["#b0b0b0"] * len(segments)
+    linewidths = [0.9] * len(segments)
     if show_weekends:
-        ax.axvline(x=5, color="green", linestyle="-",
-                   linewidth=1.5, alpha=0.8, zorder=1)
+        # Weekend divider between Friday (index 4) and Saturday (index 5)
+        segments.append([(5, start_h), (5, end_h)])
+        colors.append(to_rgba("green", 0.8))
+        linewidths.append(1.5)
+    ax.add_collection(LineCollection(
+        segments, colors=colors, linewidths=linewidths, zorder=1))
 
     # Left axis (main) - UFL Periods with time annotations
-    period_positions = []
-    for period, (start_time, end_time) in UFL_PERIODS_DISPLAY.items():
-        if start_h <= start_time <= end_h:
-            label_y = (start_time + end_time) / 2
-            period_positions.append(label_y)
-
-            # Get original time strings from UFL_PERIODS (avoid floating point errors)
-            start_orig, end_orig = UFL_PERIODS[period]
-
-            # Format using the 12h/24h toggle
-            time_str = f"{format_time_ampm(start_orig)}-{format_time_ampm(end_orig)}"
-
-            # Draw period label and time annotation
-            ax.text(-0.02, label_y - 0.005, period, fontsize=8, weight='normal',
-                    va='bottom', ha='right', color='black', transform=ax.get_yaxis_transform())
-            ax.text(-0.02, label_y + 0.005, time_str, fontsize=6,
-                    va='top', ha='right', color='gray', style='italic', transform=ax.get_yaxis_transform())
+    for label_y, period, time_str in _period_labels(
+            start_h, end_h, time_format):
+        ax.text(-0.02, label_y - 0.005, period, fontsize=8, weight='normal',
+                va='bottom', ha='right', color='black', transform=ax.get_yaxis_transform())
+        ax.text(-0.02, label_y + 0.005, time_str, fontsize=6,
+                va='top', ha='right', color='gray', style='italic', transform=ax.get_yaxis_transform())
 
     # Hide left axis ticks since we're drawing custom labels
     ax.set_yticks([])
@@ -287,32 +322,89 @@ def create_calendar_pdf(
     # Right axis (twinx) - Time with dashed grid lines
     ax2 = ax.twinx()
     ax2.set_ylim(end_h, start_h)
-    ax2.set_yticks(range(start_h, end_h + 1))
+    # Fixed labels: tick positions are known, so there is no reason to
+    # pay a Python formatter callback per tick during layout and save
+    ticks = range(start_h, end_h + 1)
+    ax2.set_yticks(ticks)
+    ax2.set_yticklabels(
+        [_format_hour_tick(float(t), time_format) for t in ticks])
     ax2.yaxis.set_minor_locator(mticker.AutoMinorLocator(2))
-    ax2.yaxis.set_major_formatter(mticker.FuncFormatter(
-        lambda v, pos: _format_hour_tick(v)))
     ax2.grid(True, which="major", axis="y",
              linestyle="--", linewidth=0.7, zorder=1)
     ax2.grid(True, which="minor", axis="y",
              linestyle=":", linewidth=0.5, zorder=1)
 
-    draw_events_on_grid(ax, events, start_h, end_h, num_days)
     ax.set_title(title, fontsize=16, pad=30)
 
-    # Tight layout with margins for labels
+    # Fixed margins instead of tight_layout: the decorations are the
+    # same on every calendar (period labels left, hour ticks right, day
+    # labels below, title above), so their space needs are known in
+    # inches and there is nothing for a full artist-bbox layout pass to
+    # discover. Insets match what tight_layout used to settle on.
     fig_width, fig_height = fig.get_size_inches()
-    margin = 0.5
-    fig.tight_layout(
-        rect=[
-            margin / fig_width,
-            margin / fig_height,
-            1 - (margin / fig_width),
-            1 - (margin / fig_height),
-        ],
-        pad=1.0,
+    fig.subplots_adjust(
+        left=_MARGIN_LEFT_IN / fig_width,
+        right=1 - _MARGIN_RIGHT_IN / fig_width,
+        bottom=_MARGIN_BOTTOM_IN / fig_height,
+        top=1 - _MARGIN_TOP_IN / fig_height,
     )
 
-    filename = f"{title.lower().replace(' ', '_')}.pdf"
-    plt.savefig(filename)
+    baseline = (len(ax.patches), len(ax.texts), len(ax.collections))
+    return fig, ax, num_days, baseline
+
+
+def create_calendar_pdf(
+    events: list,
+    title: str,
+    start_h: int,
+    end_h: int,
+    time_format: str,
+    figsize: tuple,
+    show_weekends: bool = True,
+):
+    """Creates and saves a single week's calendar PDF."""
+    global TIME_FORMAT_MODE
+    TIME_FORMAT_MODE = time_format
+
+    key = (title, start_h, end_h, time_format, figsize, show_weekends)
+    with _FIG_CACHE_LOCK:
+        skeleton = _FIG_CACHE.get(key)
+        if skeleton is None:
+            # A settings change invalidates the old skeleton for this title
+            for stale in [k for k in _FIG_CACHE if k[0] == title]:
+                del _FIG_CACHE[stale]
+            skeleton = _build_skeleton(
+                title, start_h, end_h, time_format, figsize, show_weekends)
+            _FIG_CACHE[key] = skeleton
+
+    fig, ax, num_days, baseline = skeleton
+    _clear_events(ax, baseline)
+    draw_events_on_grid(ax, events, start_h, end_h, num_days)
+
+    filename = title.lower().translate(_FN_TABLE) + ".pdf"
+    # Suppress the default Creator/Producer/date strings; they change
+    # per run and add bytes without informing anyone
+    fig.canvas.print_pdf(filename, metadata={
+        'Creator': None, 'Producer': None, 'CreationDate': None})
     print(f"✓ Generated {filename}")
-    plt.close(fig)
\ No newline at end of file
+
+
+# One pool for batch rendering, created with the module so repeated
+# batches never pay thread startup. Two workers matches the week-pair
+# workload; distinct titles use distinct cached figures, and the cache
+# dict itself is guarded by _FIG_CACHE_LOCK.
+_RENDER_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def create_calendar_pdfs(jobs: list):
+    """Renders several calendar PDFs concurrently.
+
+    Each job is an argument tuple for create_calendar_pdf. Threads
+    rather than processes: the figure skeletons and memoized helpers
+    live in this process, and the OO matplotlib API is safe to drive
+    from worker threads.
+    """
+    futures = [_RENDER_POOL.submit(create_calendar_pdf, *job)
+               for job in jobs]
+    for future in futures:
+        future.result()
\ No newline at end of file